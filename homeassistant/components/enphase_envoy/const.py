@@ -1,5 +1,5 @@
 """The enphase_envoy component."""
-
+from typing import Final
 
 from homeassistant.components.sensor import (
     STATE_CLASS_MEASUREMENT,
@@ -16,7 +16,9 @@ PLATFORMS = ["sensor"]
 COORDINATOR = "coordinator"
 NAME = "name"
 
-SENSORS = (
+_EPOCH = dt.utc_from_timestamp(0)
+
+SENSORS: Final = (
     SensorEntityDescription(
         key="production",
         name="Current Power Production",
@@ -43,7 +45,7 @@ SENSORS = (
         unit_of_measurement=ENERGY_WATT_HOUR,
         state_class=STATE_CLASS_MEASUREMENT,
         device_class=DEVICE_CLASS_ENERGY,
-        last_reset=dt.utc_from_timestamp(0),
+        last_reset=_EPOCH,
     ),
     SensorEntityDescription(
         key="consumption",
@@ -71,7 +73,7 @@ SENSORS = (
         unit_of_measurement=ENERGY_WATT_HOUR,
         state_class=STATE_CLASS_MEASUREMENT,
         device_class=DEVICE_CLASS_ENERGY,
-        last_reset=dt.utc_from_timestamp(0),
+        last_reset=_EPOCH,
     ),
     SensorEntityDescription(
         key="inverters",
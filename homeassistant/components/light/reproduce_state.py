@@ -4,8 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Iterable
 import logging
-from types import MappingProxyType
-from typing import Any, cast
+from typing import Any
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -47,7 +46,9 @@ from . import (
 
 _LOGGER = logging.getLogger(__name__)
 
-VALID_STATES = {STATE_ON, STATE_OFF}
+VALID_STATES = frozenset({STATE_ON, STATE_OFF})
+
+_SERVICE_BY_STATE = {STATE_ON: SERVICE_TURN_ON, STATE_OFF: SERVICE_TURN_OFF}
 
 ATTR_GROUP = [
     ATTR_BRIGHTNESS,
@@ -72,15 +73,18 @@ COLOR_GROUP = [
 ]
 
 COLOR_MODE_TO_ATTRIBUTE = {
-    COLOR_MODE_COLOR_TEMP: (ATTR_COLOR_TEMP, ATTR_COLOR_TEMP),
-    COLOR_MODE_HS: (ATTR_HS_COLOR, ATTR_HS_COLOR),
-    COLOR_MODE_RGB: (ATTR_RGB_COLOR, ATTR_RGB_COLOR),
-    COLOR_MODE_RGBW: (ATTR_RGBW_COLOR, ATTR_RGBW_COLOR),
-    COLOR_MODE_RGBWW: (ATTR_RGBWW_COLOR, ATTR_RGBWW_COLOR),
-    COLOR_MODE_WHITE: (ATTR_WHITE, ATTR_BRIGHTNESS),
-    COLOR_MODE_XY: (ATTR_XY_COLOR, ATTR_XY_COLOR),
+    COLOR_MODE_COLOR_TEMP: ATTR_COLOR_TEMP,
+    COLOR_MODE_HS: ATTR_HS_COLOR,
+    COLOR_MODE_RGB: ATTR_RGB_COLOR,
+    COLOR_MODE_RGBW: ATTR_RGBW_COLOR,
+    COLOR_MODE_RGBWW: ATTR_RGBWW_COLOR,
+    COLOR_MODE_WHITE: ATTR_WHITE,
+    COLOR_MODE_XY: ATTR_XY_COLOR,
 }
 
+# Color modes where the state attribute differs from the service parameter
+_COLOR_MODE_STATE_ATTR = {COLOR_MODE_WHITE: ATTR_BRIGHTNESS}
+
 DEPRECATED_GROUP = [
     ATTR_BRIGHTNESS_PCT,
     ATTR_COLOR_NAME,
@@ -90,23 +94,16 @@ DEPRECATED_GROUP = [
     ATTR_TRANSITION,
 ]
 
+_ALL_ATTRS: tuple[str, ...] = (*ATTR_GROUP, *COLOR_GROUP)
+
+_DEPRECATED_GROUP_SET = frozenset(DEPRECATED_GROUP)
+
 DEPRECATION_WARNING = (
     "The use of other attributes than device state attributes is deprecated and will be removed in a future release. "
     "Invalid attributes are %s. Read the logs for further details: https://www.home-assistant.io/integrations/scene/"
 )
 
 
-def _color_mode_same(cur_state: State, state: State) -> bool:
-    """Test if color_mode is same."""
-    cur_color_mode = cur_state.attributes.get(ATTR_COLOR_MODE, COLOR_MODE_UNKNOWN)
-    saved_color_mode = state.attributes.get(ATTR_COLOR_MODE, COLOR_MODE_UNKNOWN)
-
-    # Guard for scenes etc. which where created before color modes were introduced
-    if saved_color_mode == COLOR_MODE_UNKNOWN:
-        return True
-    return cast(bool, cur_color_mode == saved_color_mode)
-
-
 async def _async_reproduce_state(
     hass: HomeAssistant,
     state: State,
@@ -121,6 +118,9 @@ async def _async_reproduce_state(
         _LOGGER.warning("Unable to find entity %s", state.entity_id)
         return
 
+    cur_attrs = cur_state.attributes
+    new_attrs = state.attributes
+
     if state.state not in VALID_STATES:
         _LOGGER.warning(
             "Invalid state specified for %s: %s", state.entity_id, state.state
@@ -128,49 +128,60 @@ async def _async_reproduce_state(
         return
 
     # Warn if deprecated attributes are used
-    deprecated_attrs = [attr for attr in state.attributes if attr in DEPRECATED_GROUP]
-    if deprecated_attrs:
-        _LOGGER.warning(DEPRECATION_WARNING, deprecated_attrs)
+    if not _DEPRECATED_GROUP_SET.isdisjoint(new_attrs):
+        _LOGGER.warning(
+            DEPRECATION_WARNING,
+            [attr for attr in new_attrs if attr in _DEPRECATED_GROUP_SET],
+        )
 
-    if ATTR_WHITE in state.attributes and ATTR_COLOR_MODE not in state.attributes:
-        state_dict = state.as_dict()
-        state_dict["attributes"][ATTR_BRIGHTNESS] = state.attributes[ATTR_WHITE]
-        state_dict["attributes"][ATTR_COLOR_MODE] = COLOR_MODE_WHITE
-        state = State.from_dict(state_dict)
+    color_mode = new_attrs.get(ATTR_COLOR_MODE, COLOR_MODE_UNKNOWN)
+
+    if ATTR_WHITE in new_attrs and ATTR_COLOR_MODE not in new_attrs:
+        color_mode = COLOR_MODE_WHITE
+        attributes = dict(new_attrs)
+        attributes[ATTR_BRIGHTNESS] = new_attrs[ATTR_WHITE]
+        attributes[ATTR_COLOR_MODE] = color_mode
+        state = State(
+            state.entity_id,
+            state.state,
+            attributes,
+            state.last_changed,
+            state.last_updated,
+            state.context,
+            validate_entity_id=False,
+        )
+        new_attrs = state.attributes
 
     # Return if we are already at the right state.
     if (
         cur_state.state == state.state
-        and _color_mode_same(cur_state, state)
-        and all(
-            check_attr_equal(cur_state.attributes, state.attributes, attr)
-            for attr in ATTR_GROUP + COLOR_GROUP
+        # Guard for scenes etc. which where created before color modes were introduced
+        and (
+            color_mode == COLOR_MODE_UNKNOWN
+            or cur_attrs.get(ATTR_COLOR_MODE, COLOR_MODE_UNKNOWN) == color_mode
         )
+        and all(cur_attrs.get(attr) == new_attrs.get(attr) for attr in _ALL_ATTRS)
     ):
         return
 
+    service = _SERVICE_BY_STATE[state.state]
     service_data: dict[str, Any] = {ATTR_ENTITY_ID: state.entity_id}
 
     if reproduce_options is not None and ATTR_TRANSITION in reproduce_options:
         service_data[ATTR_TRANSITION] = reproduce_options[ATTR_TRANSITION]
 
     if state.state == STATE_ON:
-        service = SERVICE_TURN_ON
         for attr in ATTR_GROUP:
             # All attributes that are not colors
-            if attr in state.attributes:
-                service_data[attr] = state.attributes[attr]
+            if attr in new_attrs:
+                service_data[attr] = new_attrs[attr]
 
-        if (
-            state.attributes.get(ATTR_COLOR_MODE, COLOR_MODE_UNKNOWN)
-            != COLOR_MODE_UNKNOWN
-        ):
+        if color_mode != COLOR_MODE_UNKNOWN:
             # Remove deprecated white value if we got a valid color mode
             service_data.pop(ATTR_WHITE_VALUE, None)
-            color_mode = state.attributes[ATTR_COLOR_MODE]
-            if parameter_state := COLOR_MODE_TO_ATTRIBUTE.get(color_mode):
-                parameter, state_attr = parameter_state
-                if state_attr not in state.attributes:
+            if parameter := COLOR_MODE_TO_ATTRIBUTE.get(color_mode):
+                state_attr = _COLOR_MODE_STATE_ATTR.get(color_mode, parameter)
+                if state_attr not in new_attrs:
                     _LOGGER.warning(
                         "Color mode %s specified but attribute %s missing for: %s",
                         color_mode,
@@ -178,17 +189,14 @@ async def _async_reproduce_state(
                         state.entity_id,
                     )
                     return
-                service_data[parameter] = state.attributes[state_attr]
+                service_data[parameter] = new_attrs[state_attr]
         else:
             # Fall back to Choosing the first color that is specified
             for color_attr in COLOR_GROUP:
-                if color_attr in state.attributes:
-                    service_data[color_attr] = state.attributes[color_attr]
+                if color_attr in new_attrs:
+                    service_data[color_attr] = new_attrs[color_attr]
                     break
 
-    elif state.state == STATE_OFF:
-        service = SERVICE_TURN_OFF
-
     await hass.services.async_call(
         DOMAIN, service, service_data, context=context, blocking=True
     )
@@ -210,10 +218,3 @@ async def async_reproduce_states(
             for state in states
         )
     )
-
-
-def check_attr_equal(
-    attr1: MappingProxyType, attr2: MappingProxyType, attr_str: str
-) -> bool:
-    """Return true if the given attributes are equal."""
-    return attr1.get(attr_str) == attr2.get(attr_str)
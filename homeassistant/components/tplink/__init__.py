@@ -1,9 +1,11 @@
 """Component to embed TP-Link smart home devices."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 import time
+from typing import ClassVar
 
 from pyHS100.smartdevice import SmartDevice, SmartDeviceException
 from pyHS100.smartplug import SmartPlug
@@ -43,6 +45,7 @@ from .const import (
     CONF_SW_VERSION,
     CONF_SWITCH,
     COORDINATORS,
+    DISCOVERY_CACHE,
     PLATFORMS,
 )
 
@@ -95,17 +98,18 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up TPLink from a config entry."""
-    config_data = hass.data[DOMAIN].get(ATTR_CONFIG)
+    domain_data = hass.data[DOMAIN]
+    config_data = domain_data.get(ATTR_CONFIG)
 
     device_registry = dr.async_get(hass)
     tplink_devices = dr.async_entries_for_config_entry(device_registry, entry.entry_id)
     device_count = len(tplink_devices)
 
     # These will contain the initialized devices
-    hass.data[DOMAIN][CONF_LIGHT] = []
-    hass.data[DOMAIN][CONF_SWITCH] = []
-    lights: list[SmartDevice] = hass.data[DOMAIN][CONF_LIGHT]
-    switches: list[SmartPlug] = hass.data[DOMAIN][CONF_SWITCH]
+    lights: list[SmartDevice] = []
+    switches: list[SmartPlug] = []
+    domain_data[CONF_LIGHT] = lights
+    domain_data[CONF_SWITCH] = switches
 
     # Add static devices
     static_devices = SmartDevices()
@@ -137,20 +141,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     # prepare DataUpdateCoordinators
-    hass.data[DOMAIN][COORDINATORS] = {}
-    for switch in switches:
-
-        try:
-            await hass.async_add_executor_job(switch.get_sysinfo)
-        except SmartDeviceException as ex:
-            _LOGGER.debug(ex)
-            raise ConfigEntryNotReady from ex
-
-        hass.data[DOMAIN][COORDINATORS][
-            switch.mac
-        ] = coordinator = SmartPlugDataUpdateCoordinator(hass, switch)
-
-        await coordinator.async_config_entry_first_refresh()
+    try:
+        await asyncio.gather(
+            *(hass.async_add_executor_job(switch.get_sysinfo) for switch in switches)
+        )
+    except SmartDeviceException as ex:
+        _LOGGER.debug(ex)
+        raise ConfigEntryNotReady from ex
+
+    domain_data[COORDINATORS] = coordinators = {
+        switch.mac: SmartPlugDataUpdateCoordinator(hass, switch) for switch in switches
+    }
+
+    await asyncio.gather(
+        *(
+            coordinator.async_config_entry_first_refresh()
+            for coordinator in coordinators.values()
+        )
+    )
 
     hass.config_entries.async_setup_platforms(entry, PLATFORMS)
 
@@ -159,17 +167,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    platforms = [platform for platform in PLATFORMS if hass.data[DOMAIN].get(platform)]
+    domain_data = hass.data[DOMAIN]
+    platforms = [platform for platform in PLATFORMS if domain_data.get(platform)]
     unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
     if unload_ok:
-        hass.data[DOMAIN].clear()
+        # Keep recent discovery results so a reload does not rediscover
+        discovery_cache = domain_data.pop(DISCOVERY_CACHE, None)
+        domain_data.clear()
+        if discovery_cache is not None:
+            domain_data[DISCOVERY_CACHE] = discovery_cache
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop cached discovery results when the config entry is removed."""
+    hass.data.get(DOMAIN, {}).pop(DISCOVERY_CACHE, None)
+
+
 class SmartPlugDataUpdateCoordinator(DataUpdateCoordinator):
     """DataUpdateCoordinator to gather data for specific SmartPlug."""
 
+    _EPOCH: ClassVar[datetime] = utc_from_timestamp(0)
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -177,6 +197,7 @@ class SmartPlugDataUpdateCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Initialize DataUpdateCoordinator to gather data for specific SmartPlug."""
         self.smartplug = smartplug
+        self._on_state = smartplug.SWITCH_STATE_ON
 
         update_interval = timedelta(seconds=30)
         super().__init__(
@@ -196,38 +217,34 @@ class SmartPlugDataUpdateCoordinator(DataUpdateCoordinator):
             if self.smartplug.context is None:
                 data[CONF_ALIAS] = info["alias"]
                 data[CONF_DEVICE_ID] = info["mac"]
-                data[CONF_STATE] = (
-                    self.smartplug.state == self.smartplug.SWITCH_STATE_ON
-                )
+                data[CONF_STATE] = self.smartplug.state == self._on_state
             else:
                 plug_from_context = next(
-                    c
-                    for c in self.smartplug.sys_info["children"]
-                    if c["id"] == self.smartplug.context
+                    c for c in info["children"] if c["id"] == self.smartplug.context
                 )
                 data[CONF_ALIAS] = plug_from_context["alias"]
                 data[CONF_DEVICE_ID] = self.smartplug.context
                 data[CONF_STATE] = plug_from_context["state"] == 1
             if self.smartplug.has_emeter:
                 emeter_readings = self.smartplug.get_emeter_realtime()
+                emeter_statics = self.smartplug.get_emeter_daily()
+                # daily statistics are keyed by the day of month in local time
+                if (today_kwh := emeter_statics.get(time.localtime().tm_mday)) is None:
+                    # today's consumption not available, when device was off all the day
+                    today_kwh = 0.0
                 data[CONF_EMETER_PARAMS] = {
                     ATTR_CURRENT_POWER_W: round(float(emeter_readings["power"]), 2),
                     ATTR_TOTAL_ENERGY_KWH: round(float(emeter_readings["total"]), 3),
                     ATTR_VOLTAGE: round(float(emeter_readings["voltage"]), 1),
                     ATTR_CURRENT_A: round(float(emeter_readings["current"]), 2),
-                    ATTR_LAST_RESET: {ATTR_TOTAL_ENERGY_KWH: utc_from_timestamp(0)},
+                    ATTR_LAST_RESET: {
+                        ATTR_TOTAL_ENERGY_KWH: self._EPOCH,
+                        ATTR_TODAY_ENERGY_KWH: datetime.utcnow().replace(
+                            hour=0, minute=0, second=0, microsecond=0
+                        ),
+                    },
+                    ATTR_TODAY_ENERGY_KWH: round(float(today_kwh), 3),
                 }
-                emeter_statics = self.smartplug.get_emeter_daily()
-                data[CONF_EMETER_PARAMS][ATTR_LAST_RESET][
-                    ATTR_TODAY_ENERGY_KWH
-                ] = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-                if emeter_statics.get(int(time.strftime("%e"))):
-                    data[CONF_EMETER_PARAMS][ATTR_TODAY_ENERGY_KWH] = round(
-                        float(emeter_statics[int(time.strftime("%e"))]), 3
-                    )
-                else:
-                    # today's consumption not available, when device was off all the day
-                    data[CONF_EMETER_PARAMS][ATTR_TODAY_ENERGY_KWH] = 0.0
         except SmartDeviceException as ex:
             raise UpdateFailed(ex) from ex
 
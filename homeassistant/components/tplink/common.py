@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Callable
 
 from pyHS100 import (
@@ -21,6 +22,8 @@ from .const import (
     CONF_LIGHT,
     CONF_STRIP,
     CONF_SWITCH,
+    DISCOVERY_CACHE,
+    DISCOVERY_CACHE_TTL,
     DOMAIN as TPLINK_DOMAIN,
     MAX_DISCOVERY_RETRIES,
 )
@@ -97,7 +100,20 @@ async def async_discover_devices(
             else:
                 _LOGGER.error("Unknown smart device type: %s", type(dev))
 
-    devices: dict[str, SmartDevice] = {}
+    # Reuse a recent discovery, e.g. when the config entry is reloaded
+    domain_data = hass.data[TPLINK_DOMAIN]
+    cache = domain_data.get(DISCOVERY_CACHE)
+    if (
+        cache is not None
+        and time.monotonic() - cache[0] < DISCOVERY_CACHE_TTL
+        and len(cache[1]) >= target_device_count
+    ):
+        _LOGGER.debug("Using %s cached TP-Link smart home device(s)", len(cache[1]))
+        devices = cache[1]
+        await hass.async_add_executor_job(process_devices)
+        return SmartDevices(lights, switches)
+
+    devices = {}
     for attempt in range(1, MAX_DISCOVERY_RETRIES + 1):
         _LOGGER.debug(
             "Discovering tplink devices, attempt %s of %s",
@@ -124,6 +140,7 @@ async def async_discover_devices(
         len(devices),
         attempt,
     )
+    domain_data[DISCOVERY_CACHE] = (time.monotonic(), devices)
     await hass.async_add_executor_job(process_devices)
 
     return SmartDevices(lights, switches)
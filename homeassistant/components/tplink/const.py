@@ -8,6 +8,8 @@ COORDINATORS = "coordinators"
 
 MIN_TIME_BETWEEN_UPDATES = datetime.timedelta(seconds=8)
 MAX_DISCOVERY_RETRIES = 4
+DISCOVERY_CACHE = "discovery_cache"
+DISCOVERY_CACHE_TTL = 30
 
 ATTR_CONFIG = "config"
 ATTR_TOTAL_ENERGY_KWH = "total_energy_kwh"
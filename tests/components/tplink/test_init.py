@@ -11,7 +11,7 @@ import pytest
 
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.components import tplink
-from homeassistant.components.tplink.common import SmartDevices
+from homeassistant.components.tplink.common import SmartDevices, async_discover_devices
 from homeassistant.components.tplink.const import (
     CONF_DIMMER,
     CONF_DISCOVERY,
@@ -19,6 +19,8 @@ from homeassistant.components.tplink.const import (
     CONF_SW_VERSION,
     CONF_SWITCH,
     COORDINATORS,
+    DISCOVERY_CACHE,
+    DISCOVERY_CACHE_TTL,
 )
 from homeassistant.components.tplink.sensor import ENERGY_SENSORS
 from homeassistant.const import CONF_ALIAS, CONF_DEVICE_ID, CONF_HOST
@@ -196,6 +198,69 @@ async def test_configuring_discovery_disabled(hass):
     assert mock_setup.call_count == 1
 
 
+async def test_reload_uses_discovery_cache(hass):
+    """Test that reloading within the cache TTL does not rediscover."""
+    with patch(
+        "homeassistant.components.tplink.common.Discover.discover"
+    ) as discover, patch(
+        "homeassistant.components.tplink.common.SmartDevice._query_helper"
+    ), patch(
+        "homeassistant.components.tplink.light.async_setup_entry",
+        return_value=True,
+    ):
+        discover.return_value = {"123.123.123.1": SmartBulb("123.123.123.1")}
+        await async_setup_component(hass, tplink.DOMAIN, {tplink.DOMAIN: {}})
+        await hass.async_block_till_done()
+
+        entries = hass.config_entries.async_entries(tplink.DOMAIN)
+        assert len(entries) == 1
+        assert await hass.config_entries.async_reload(entries[0].entry_id)
+        await hass.async_block_till_done()
+
+        assert len(discover.mock_calls) == 1
+        assert len(hass.data[tplink.DOMAIN][CONF_LIGHT]) == 1
+
+        assert await hass.config_entries.async_remove(entries[0].entry_id)
+        await hass.async_block_till_done()
+
+    assert DISCOVERY_CACHE not in hass.data[tplink.DOMAIN]
+
+
+async def test_expired_discovery_cache_rediscovers(hass):
+    """Test that an expired discovery cache is not used."""
+    hass.data[tplink.DOMAIN] = {
+        DISCOVERY_CACHE: (
+            time.monotonic() - DISCOVERY_CACHE_TTL - 1,
+            {"123.123.123.1": SmartBulb("123.123.123.1")},
+        )
+    }
+    with patch("homeassistant.components.tplink.common.Discover.discover") as discover:
+        discover.return_value = {"123.123.123.2": SmartBulb("123.123.123.2")}
+        devices = await async_discover_devices(hass, SmartDevices(), 0)
+
+    assert len(discover.mock_calls) == 1
+    assert [light.host for light in devices.lights] == ["123.123.123.2"]
+
+
+async def test_incomplete_discovery_cache_rediscovers(hass):
+    """Test that a cache with fewer devices than expected is not used."""
+    hass.data[tplink.DOMAIN] = {
+        DISCOVERY_CACHE: (
+            time.monotonic(),
+            {"123.123.123.1": SmartBulb("123.123.123.1")},
+        )
+    }
+    with patch("homeassistant.components.tplink.common.Discover.discover") as discover:
+        discover.return_value = {
+            "123.123.123.1": SmartBulb("123.123.123.1"),
+            "123.123.123.2": SmartBulb("123.123.123.2"),
+        }
+        devices = await async_discover_devices(hass, SmartDevices(), 2)
+
+    assert len(discover.mock_calls) == 1
+    assert len(devices.lights) == 2
+
+
 async def test_platforms_are_initialized(hass: HomeAssistant):
     """Test that platforms are initialized per configuration array."""
     config = {